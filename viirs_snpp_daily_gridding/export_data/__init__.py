@@ -1 +1,2 @@
-from .export import export_netcdf
\ No newline at end of file
+from .export import export_netcdf
+from .writer import NetCDFWriter
\ No newline at end of file
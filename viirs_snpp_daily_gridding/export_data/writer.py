@@ -0,0 +1,64 @@
+import multiprocessing
+from viirs_snpp_daily_gridding.logs import logger
+from .export import export_netcdf
+
+
+def _writer_loop(queue) -> None:
+    """
+    Target of the writer process: drains export payloads off the queue and
+    writes them sequentially until the stop sentinel (None) arrives.
+
+    Running all NetCDF writes in one long-lived process means the HDF5 library
+    state, compression filter setup and page cache are initialized once and
+    stay warm across days, instead of every worker paying that cost and
+    contending on the filesystem.
+    """
+    while True:
+        payload = queue.get()
+        if payload is None:
+            break
+        try:
+            export_netcdf(*payload)
+        except Exception as e:
+            logger.error("NetCDF writer failed on a queued export: %s", e)
+
+
+class NetCDFWriter:
+    """
+    Dedicated single-writer process for NetCDF exports.
+
+    Workers put their gridded arrays and metadata (the export_netcdf argument
+    tuple) on .queue instead of writing the file themselves; the writer drains
+    the queue sequentially. The queue comes from a multiprocessing.Manager so
+    it can be pickled into joblib's loky workers.
+    """
+
+    def __init__(self):
+        self._manager = multiprocessing.Manager()
+        self._queue = self._manager.Queue()
+        self._process = None
+
+    @property
+    def queue(self):
+        """The queue worker processes submit export payloads to."""
+        return self._queue
+
+    def start(self) -> None:
+        """Starts the writer process."""
+        self._process = multiprocessing.Process(target=_writer_loop, args=(self._queue,), daemon=True)
+        self._process.start()
+
+    def stop(self) -> None:
+        """Signals the writer to finish the queued writes and waits for it."""
+        if self._process is not None:
+            self._queue.put(None)
+            self._process.join()
+            self._process = None
+        self._manager.shutdown()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
@@ -15,9 +15,23 @@ if not MAIN_PID:
     os.environ['MAIN_PID'] = str(os.getpid())
     MAIN_PID = os.environ['MAIN_PID']
 
+# The pid never changes within a process, so resolve the comparison once at
+# import time instead of a getpid syscall plus string compare per check
+_IS_MAIN = str(os.getpid()) == MAIN_PID
+
+# Levels of the standard logging methods, for the suppressed-level fast path
+_METHOD_LEVELS = {
+    'debug': logging.DEBUG,
+    'info': logging.INFO,
+    'warning': logging.WARNING,
+    'error': logging.ERROR,
+    'exception': logging.ERROR,
+    'critical': logging.CRITICAL,
+}
+
 def is_main_process():
     """Determine if current process is the main application process"""
-    return str(os.getpid()) == MAIN_PID
+    return _IS_MAIN
 
 class ProcessLogger:
     def __init__(self):
@@ -26,6 +40,7 @@ class ProcessLogger:
         self._formatter = None
         self._date_range = None
         self._console_fallback = False
+        self._proxies = {}
 
     def set_date_range(self, start_date, end_date):
         """Set date range for main process logs (optional)"""
@@ -76,13 +91,24 @@ class ProcessLogger:
 
     def __getattr__(self, name):
         """Delegate logging methods to the current logger"""
-        logger = self._get_logger()
-        def logging_proxy(msg, *args, **kwargs):
-            extra = kwargs.get('extra', {})
-            extra['data_date'] = getattr(self._formatter, 'default_data_date', 'N/A') if self._formatter else 'N/A'
-            kwargs['extra'] = extra
-            return getattr(logger, name)(msg, *args, **kwargs)
-        return logging_proxy
+        # Memoize one proxy per method name instead of building a new closure
+        # on every log call. The proxy resolves the logger lazily so a
+        # set_date() reset still takes effect.
+        proxy = self._proxies.get(name)
+        if proxy is None:
+            level = _METHOD_LEVELS.get(name)
+            def logging_proxy(msg, *args, **kwargs):
+                logger = self._get_logger()
+                # Fast path: skip the extra-dict assembly (and %-formatting
+                # inside logging) when the level is suppressed
+                if level is not None and not logger.isEnabledFor(level):
+                    return None
+                extra = kwargs.get('extra', {})
+                extra['data_date'] = getattr(self._formatter, 'default_data_date', 'N/A') if self._formatter else 'N/A'
+                kwargs['extra'] = extra
+                return getattr(logger, name)(msg, *args, **kwargs)
+            proxy = self._proxies[name] = logging_proxy
+        return proxy
 
 # Global logger instance (console only)
 logger = ProcessLogger()
\ No newline at end of file
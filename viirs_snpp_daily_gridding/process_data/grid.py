@@ -1,6 +1,86 @@
+import functools
 import numpy as np
+from numba import njit, prange, get_num_threads
 from typing import Tuple
 
+
+@njit(parallel=True, fastmath=True)
+def _grid_kernel(indata, inlat, inlon, vza, minlat, maxlat, minlon, maxlon, dx, dy, xdim, ydim):
+	"""
+    Compiled accumulation pass: walks the pixel arrays once, computes each
+    pixel's cell index and updates sum/sum-of-squares/VZA/count/min/max in
+    place — no fancy-indexing temporaries, and parallel over pixel chunks with
+    per-thread private accumulators that are reduced at the end. The thread
+    count for the privatized grids is capped so the (nthreads, xdim, ydim)
+    scratch arrays stay bounded at global 0.1-degree resolution.
+    """
+	nthreads = min(get_num_threads(), 8)
+	sumtau_t = np.zeros((nthreads, xdim, ydim), dtype=np.float32)
+	sqrtau_t = np.zeros((nthreads, xdim, ydim), dtype=np.float32)
+	sum_vza_t = np.zeros((nthreads, xdim, ydim), dtype=np.float32)
+	count_t = np.zeros((nthreads, xdim, ydim), dtype=np.int64)
+	mintau_t = np.full((nthreads, xdim, ydim), 10.0, dtype=np.float32)
+	maxtau_t = np.full((nthreads, xdim, ydim), -1.0, dtype=np.float32)
+
+	n = indata.size
+	chunk = (n + nthreads - 1) // nthreads
+	for t in prange(nthreads):
+		start = t * chunk
+		end = min(start + chunk, n)
+		for k in range(start, end):
+			la = inlat[k]
+			lo = inlon[k]
+			if minlat <= la <= maxlat and minlon <= lo <= maxlon:
+				i = int((lo - minlon) / dx)
+				j = int((la - minlat) / dy)
+				a = indata[k]
+				sumtau_t[t, i, j] += a
+				sqrtau_t[t, i, j] += a * a
+				sum_vza_t[t, i, j] += vza[k]
+				count_t[t, i, j] += 1
+				if a < mintau_t[t, i, j]:
+					mintau_t[t, i, j] = a
+				if a > maxtau_t[t, i, j]:
+					maxtau_t[t, i, j] = a
+
+	sumtau = np.zeros((xdim, ydim), dtype=np.float32)
+	sqrtau = np.zeros((xdim, ydim), dtype=np.float32)
+	sum_vza = np.zeros((xdim, ydim), dtype=np.float32)
+	count = np.zeros((xdim, ydim), dtype=np.int64)
+	mintau = np.full((xdim, ydim), 10.0, dtype=np.float32)
+	maxtau = np.full((xdim, ydim), -1.0, dtype=np.float32)
+	for t in range(nthreads):
+		for i in range(xdim):
+			for j in range(ydim):
+				sumtau[i, j] += sumtau_t[t, i, j]
+				sqrtau[i, j] += sqrtau_t[t, i, j]
+				sum_vza[i, j] += sum_vza_t[t, i, j]
+				count[i, j] += count_t[t, i, j]
+				if mintau_t[t, i, j] < mintau[i, j]:
+					mintau[i, j] = mintau_t[t, i, j]
+				if maxtau_t[t, i, j] > maxtau[i, j]:
+					maxtau[i, j] = maxtau_t[t, i, j]
+
+	return sumtau, sqrtau, sum_vza, count, mintau, maxtau
+
+
+@functools.lru_cache(maxsize=8)
+def _grid_axes(minlat: float, maxlat: float, minlon: float, maxlon: float, gsize: float) -> Tuple[np.ndarray, np.ndarray]:
+	"""
+    Returns the (grdlat, grdlon) 1D coordinate axes for the given bounds and
+    resolution. The axes are linear, so the full 2D meshes the gridder used to
+    carry (~25 MB at global 0.1 degrees) were pure redundancy; downstream code
+    only ever needed the axes. Bounds are fixed for the lifetime of a job, so
+    the arrays are computed once per process and shared read-only.
+    """
+	xdim=round(1+((maxlon-minlon)/gsize))
+	ydim=round(1+((maxlat-minlat)/gsize))
+	grdlon=np.arange(xdim, dtype=np.float32)*gsize+minlon
+	grdlat=np.arange(ydim, dtype=np.float32)*gsize+minlat
+	grdlon.flags.writeable=False
+	grdlat.flags.writeable=False
+	return grdlat, grdlon
+
 def grid(
     limit: list[float], 
     gsize: float, 
@@ -25,8 +105,8 @@ def grid(
             A tuple containing the following 2D arrays:
             - avgtau (np.ndarray): Average values in each grid cell.
             - stdtau (np.ndarray): Standard deviation of values in each grid cell.
-            - grdlat (np.ndarray): Latitudes of the grid cells.
-            - grdlon (np.ndarray): Longitudes of the grid cells.
+            - grdlat (np.ndarray): 1D latitude axis of the grid.
+            - grdlon (np.ndarray): 1D longitude axis of the grid.
             - mintau (np.ndarray): Minimum values in each grid cell.
             - maxtau (np.ndarray): Maximum values in each grid cell.
             - count (np.ndarray): Count of data points in each grid cell.
@@ -40,45 +120,153 @@ def grid(
 	maxlon=float(limit[3])
 	xdim=round(1+((maxlon-minlon)/dx))
 	ydim=round(1+((maxlat-minlat)/dy))
-	sumtau=np.zeros((xdim,ydim), dtype=np.float32)
-	sum_vza = np.zeros((xdim,ydim), dtype=np.float32)
-	sqrtau=np.zeros((xdim,ydim), dtype=np.float32)
-	count=np.zeros((xdim,ydim), dtype=int)
-	mintau=np.full([xdim,ydim], 10, dtype=np.float32)
-	maxtau=np.full([xdim,ydim], -1, dtype=np.float32)
-	avgtau=np.full([xdim,ydim], -999.0, dtype=np.float32)
-	avg_vza = np.full([xdim,ydim], -999.0, dtype=np.float32)
-	stdtau=np.full([xdim,ydim], -999.0, dtype=np.float32)
-	grdlat=np.full([xdim,ydim], -999.0, dtype=np.float32)
-	grdlon=np.full([xdim,ydim], -999.0, dtype=np.float32)
-	
-	for ii in range(len(indata)):
-		if (inlat[ii]>=minlat and inlat[ii] <= maxlat and inlon[ii]>= minlon and inlon[ii] <= maxlon):
-			i=int((inlon[ii]-minlon)/dx)
-			j=int((inlat[ii]-minlat)/dy)
-			sumtau[i,j]=sumtau[i,j]+indata[ii]
-			sum_vza[i,j] = sum_vza[i,j] + vza[ii]
-
-			sqrtau[i,j]=sqrtau[i,j]+(indata[ii])**2
-			count[i,j]+=1
-			if indata[ii] < mintau[i,j]:
-				mintau[i,j]=indata[ii]
-			if indata[ii] > maxtau[i,j]:
-				maxtau[i,j]=indata[ii]
-				
-	for i in range(xdim):
-		for j in range(ydim):
-			grdlon[i,j]=dx*i+minlon
-			grdlat[i,j]=dx*j+minlat
-			if count[i,j] > 0:
-				avgtau[i,j]=sumtau[i,j]/count[i,j]
-				avg_vza[i,j] = sum_vza[i,j] / count[i,j]
-				para1 = (1 / count[i, j]) * (sqrtau[i, j] + count[i, j] * avgtau[i, j] *avgtau[i, j] - 2 * avgtau[i, j] * sumtau[i, j])
-				if para1 > 0:
-					stdtau[i,j]=np.sqrt(para1)
+
+	indata=np.asarray(indata, dtype=np.float32)
+	inlat=np.asarray(inlat, dtype=np.float32)
+	inlon=np.asarray(inlon, dtype=np.float32)
+	vza=np.asarray(vza, dtype=np.float32)
+
+	# compiled single-pass binning: no fancy-indexing temporaries, parallel
+	# over pixel chunks with per-thread accumulators
+	sumtau, sqrtau, sum_vza, count, mintau, maxtau = _grid_kernel(
+		np.ascontiguousarray(indata), np.ascontiguousarray(inlat),
+		np.ascontiguousarray(inlon), np.ascontiguousarray(vza),
+		minlat, maxlat, minlon, maxlon, dx, dy, xdim, ydim)
+
+	grdlat, grdlon=_grid_axes(minlat, maxlat, minlon, maxlon, gsize)
+
+	# finish the reduction with array ops — variance = E[x^2] - E[x]^2 — so no
+	# Python loop over the xdim*ydim cells remains
+	occupied=count>0
+	divisor=np.maximum(count,1)
+	avgtau=np.where(occupied, sumtau/divisor, -999.0).astype(np.float32)
+	avg_vza=np.where(occupied, sum_vza/divisor, -999.0).astype(np.float32)
+	var=sqrtau/divisor - (sumtau/divisor)**2
+	stdtau=np.where(occupied & (var>0), np.sqrt(np.maximum(var,0)), -999.0).astype(np.float32)
 
 	mintau[mintau == 10] = -1
-	count[count == 0] = -999
-	count = count.astype(np.int32)
-	
-	return avgtau, stdtau, grdlat, grdlon, mintau, maxtau, count, avg_vza
\ No newline at end of file
+	count=np.where(occupied, count, -999).astype(np.int32)
+
+	return avgtau, stdtau, grdlat, grdlon, mintau, maxtau, count, avg_vza
+
+
+def grid_multi(
+    limit: list[float],
+    gsize: float,
+    indata_list: list[np.ndarray],
+    inlat_list: list[np.ndarray],
+    inlon_list: list[np.ndarray],
+    vza_list: list[np.ndarray],
+    combine: bool = False,
+    ) -> Tuple[np.ndarray, np.ndarray, list]:
+	"""
+    Grids several datasets sharing the same bounds in a single binning traversal.
+
+    The per-channel inputs (e.g. Deep Blue and Dark Target pixels for the same
+    day) are stacked with an integer channel tag so the bin indices are computed
+    once and the accumulation runs as a handful of C-level bincount calls,
+    instead of one full grid() pass per dataset.
+
+    Args:
+        limit (list[float]): Grid limits [min_lat, max_lat, min_lon, max_lon].
+        gsize (float): The grid size, defining the resolution in degrees.
+        indata_list (list[np.ndarray]): Input data values, one array per channel.
+        inlat_list (list[np.ndarray]): Latitudes per channel.
+        inlon_list (list[np.ndarray]): Longitudes per channel.
+        vza_list (list[np.ndarray]): Viewing zenith angles per channel.
+        combine (bool): When True (requires exactly two channels, DB then DT),
+            the combined (dbdt, dtdb, avg) products are derived in the same
+            finishing pass, while the per-channel averages are still hot in
+            cache, instead of re-reading the full grids in a separate step.
+
+    Returns:
+        Tuple: (grdlat, grdlon, channels) — grdlat/grdlon are the 1D grid
+            coordinate axes and channels the per-channel tuples of
+            (avgtau, stdtau, mintau, maxtau, count, avg_vza) 2D arrays. With
+            combine=True a fourth element (dbdt_tau, dtdb_tau, avg_tau) is
+            appended.
+    """
+	dy=gsize
+	dx=gsize
+	minlat=float(limit[0])
+	maxlat=float(limit[1])
+	minlon=float(limit[2])
+	maxlon=float(limit[3])
+	xdim=round(1+((maxlon-minlon)/dx))
+	ydim=round(1+((maxlat-minlat)/dy))
+	nchan=len(indata_list)
+	ncell=xdim*ydim
+
+	# no-op for the float32 arrays produced by the read path, but keeps other
+	# callers from silently doubling the bandwidth of the binning pass
+	indata=np.concatenate([np.asarray(a, dtype=np.float32) for a in indata_list])
+	inlat=np.concatenate([np.asarray(a, dtype=np.float32) for a in inlat_list])
+	inlon=np.concatenate([np.asarray(a, dtype=np.float32) for a in inlon_list])
+	vza=np.concatenate([np.asarray(a, dtype=np.float32) for a in vza_list])
+	channel=np.repeat(np.arange(nchan, dtype=np.intp), [len(a) for a in indata_list])
+
+	valid=(inlat>=minlat)&(inlat<=maxlat)&(inlon>=minlon)&(inlon<=maxlon)
+	indata=indata[valid]
+	vza=vza[valid]
+	i=((inlon[valid]-minlon)/dx).astype(np.intp)
+	j=((inlat[valid]-minlat)/dy).astype(np.intp)
+	lin=channel[valid]*ncell + i*ydim + j
+
+	count=np.bincount(lin, minlength=nchan*ncell)
+	sumtau=np.bincount(lin, weights=indata, minlength=nchan*ncell)
+	sqrtau=np.bincount(lin, weights=indata*indata, minlength=nchan*ncell)
+	sum_vza=np.bincount(lin, weights=vza, minlength=nchan*ncell)
+	# Per-cell min/max via one sort plus reduceat: ufunc.at runs a slow
+	# element-at-a-time inner loop, while sorting the pixels by bin index and
+	# reducing each contiguous run stays in C throughout (~an order of
+	# magnitude faster at L2 pixel counts)
+	mintau=np.full(nchan*ncell, 10, dtype=np.float32)
+	maxtau=np.full(nchan*ncell, -1, dtype=np.float32)
+	if lin.size:
+		order=np.argsort(lin, kind='stable')
+		lin_s=lin[order]
+		data_s=indata[order]
+		uniq, starts=np.unique(lin_s, return_index=True)
+		mintau[uniq]=np.minimum.reduceat(data_s, starts)
+		maxtau[uniq]=np.maximum.reduceat(data_s, starts)
+
+	grdlat, grdlon=_grid_axes(minlat, maxlat, minlon, maxlon, gsize)
+
+	channels=[]
+	for c in range(nchan):
+		cnt=count[c*ncell:(c+1)*ncell].reshape(xdim,ydim)
+		stau=sumtau[c*ncell:(c+1)*ncell].reshape(xdim,ydim)
+		qtau=sqrtau[c*ncell:(c+1)*ncell].reshape(xdim,ydim)
+		svza=sum_vza[c*ncell:(c+1)*ncell].reshape(xdim,ydim)
+		mnt=mintau[c*ncell:(c+1)*ncell].reshape(xdim,ydim).copy()
+		mxt=maxtau[c*ncell:(c+1)*ncell].reshape(xdim,ydim).copy()
+
+		occupied=cnt>0
+		divisor=np.maximum(cnt,1)
+		avgtau=np.where(occupied, stau/divisor, -999.0).astype(np.float32)
+		avg_vza=np.where(occupied, svza/divisor, -999.0).astype(np.float32)
+		var=qtau/divisor - (stau/divisor)**2
+		stdtau=np.where(occupied & (var>0), np.sqrt(np.maximum(var,0)), -999.0).astype(np.float32)
+
+		mnt[mnt == 10] = -1
+		cnt=np.where(occupied, cnt, -999).astype(np.int32)
+		channels.append((avgtau, stdtau, mnt, mxt, cnt, avg_vza))
+
+	if not combine:
+		return grdlat, grdlon, channels
+
+	if nchan != 2:
+		raise ValueError("combine=True requires exactly two channels (DB, DT)")
+
+	# Derive the combined products right here, while the two average grids are
+	# still hot in cache, rather than re-reading them in a separate pipeline
+	# stage (see combine_db_dt.db_dt_processing for the reference semantics)
+	avg_db=channels[0][0]
+	avg_dt=channels[1][0]
+	db_valid=avg_db != -999.0
+	dt_valid=avg_dt != -999.0
+	dbdt_tau=np.where(db_valid, avg_db, np.where(dt_valid, avg_dt, -999.0))
+	dtdb_tau=np.where(dt_valid, avg_dt, np.where(db_valid, avg_db, -999.0))
+	avg_tau=np.where(db_valid & dt_valid, (avg_db+avg_dt)/2.0, dbdt_tau)
+
+	return grdlat, grdlon, channels, (dbdt_tau, dtdb_tau, avg_tau)
\ No newline at end of file
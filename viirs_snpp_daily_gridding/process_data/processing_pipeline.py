@@ -1,14 +1,151 @@
 import os
+import glob
 import time
-import numpy as np
 from datetime import datetime
-from viirs_snpp_daily_gridding.logs import logger 
+from concurrent.futures import ThreadPoolExecutor
+from viirs_snpp_daily_gridding.logs import logger
 from viirs_snpp_daily_gridding.export_data import export_netcdf
-from viirs_snpp_daily_gridding.web_scraping import get_file_list_dynamically
-from .grid import grid
-from .combine_db_dt import db_dt_processing
+from viirs_snpp_daily_gridding.web_scraping import get_file_list_dynamically, s3_list_files
+from viirs_snpp_daily_gridding.s3_authentication import RefreshingCreds
+from .grid import grid_multi
 from .read_and_process_files import process_files
 
+
+def _list_day_files(year: str, day: str, product: str, creds_dict: dict) -> list[str]:
+    """
+    Lists a day's granules, preferring the authenticated S3 listing (one
+    compact paginated call) over the HTML index scrape, which remains as a
+    fallback if the bucket listing is denied or empty.
+    """
+    try:
+        files = s3_list_files(product, year, day, creds_dict)
+        if files:
+            return files
+    except Exception as e:
+        logger.warning("S3 listing failed for %s %s%s, falling back to web scrape: %s", product, year, day, e)
+    return get_file_list_dynamically(year, day, product)
+
+
+def fetch_day_arrays(year: str, day: str, creds: dict) -> tuple:
+    """
+    I/O phase of a day's processing: lists the AERDB/AERDT granules and reads
+    both products concurrently. Everything here is dominated by network waits
+    (LAADS listing requests and S3 range reads), so the work runs in a small
+    thread pool and the GIL is released during the blocking calls.
+
+    Args:
+        year (str): The year of the data to fetch (e.g., "2023").
+        day (str): The day of the year of the data to fetch (e.g., "001").
+        creds (dict): The AWS credentials for accessing the data.
+
+    Returns:
+        tuple: (files_AERDB, files_AERDT, db_arrays, dt_arrays) where each
+            *_arrays entry is the (aod, lat, lon, vza) tuple from process_files.
+    """
+    creds_dict = creds.get() if isinstance(creds, RefreshingCreds) else creds
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        future_db_files = executor.submit(_list_day_files, year, day, "AERDB_L2_VIIRS_SNPP", creds_dict)
+        future_dt_files = executor.submit(_list_day_files, year, day, "AERDT_L2_VIIRS_SNPP", creds_dict)
+        files_AERDB = future_db_files.result()
+        files_AERDT = future_dt_files.result()
+
+        if not files_AERDB:
+            raise FileNotFoundError("No valid AERDB files found for the specified date range. Please verify the folder path and date range in the configuration.")
+        if not files_AERDT:
+            raise FileNotFoundError("No valid AERDT files found for the specified date range.")
+
+        future_db = executor.submit(process_files, files_AERDB, "SNPP", "AERDB", -0.05, 5.0, creds)
+        future_dt = executor.submit(process_files, files_AERDT, "SNPP", "AERDT", -0.05, 5.0, creds)
+        db_arrays = future_db.result()
+        dt_arrays = future_dt.result()
+
+    return files_AERDB, files_AERDT, db_arrays, dt_arrays
+
+
+def grid_and_export(
+    grid_size: float,
+    year: str,
+    day: str,
+    data_export_path: str,
+    min_lon: float,
+    max_lon: float,
+    min_lat: float,
+    max_lat: float,
+    files_AERDB: list[str],
+    files_AERDT: list[str],
+    db_arrays: tuple,
+    dt_arrays: tuple,
+    writer_queue=None,
+) -> None:
+    """
+    CPU phase of a day's processing: grids both products in one fused pass,
+    combines them, and exports the NetCDF file. When a writer queue is given,
+    the export payload is handed to the dedicated NetCDFWriter process instead
+    of writing from this worker.
+
+    Args:
+        grid_size (float): The size of the grid cells for gridding the data.
+        year (str): The year of the data being processed.
+        day (str): The day of the year being processed.
+        data_export_path (str): The path where the processed data will be exported.
+        min_lon (float): The minimum longitude for the region of interest.
+        max_lon (float): The maximum longitude for the region of interest.
+        min_lat (float): The minimum latitude for the region of interest.
+        max_lat (float): The maximum latitude for the region of interest.
+        files_AERDB (list[str]): AERDB granule names used for the file metadata.
+        files_AERDT (list[str]): AERDT granule names used for the file metadata.
+        db_arrays (tuple): (aod, lat, lon, vza) arrays for Deep Blue.
+        dt_arrays (tuple): (aod, lat, lon, vza) arrays for Dark Target.
+
+    Returns:
+        None
+    """
+    aod_db, lat_db, lon_db, vza_db = db_arrays
+    aod_dt, lat_dt, lon_dt, vza_dt = dt_arrays
+
+    # Grid both datasets and derive the combined DB/DT products in a single
+    # fused pass
+    grdlat, grdlon, channels, combined = grid_multi(
+        [min_lat, max_lat, min_lon, max_lon],
+        grid_size,
+        [aod_db, aod_dt],
+        [lat_db, lat_dt],
+        [lon_db, lon_dt],
+        [vza_db, vza_dt],
+        combine=True,
+    )
+    avgtau_db, stdtau_db, _, _, count_db, _ = channels[0]
+    avgtau_dt, stdtau_dt, _, _, count_dt, sensorZenithAngle_dt = channels[1]
+    dbdt_tau, dtdb_tau, avg_tau = combined
+
+    logger.info(f"Gridding and combining AERDB and AERDT data for {year+day} completed.")
+
+    # Export results to NetCDF
+    export_args = (
+        grdlon,
+        grdlat,
+        dbdt_tau,
+        dtdb_tau,
+        avg_tau,
+        avgtau_db,
+        count_db,
+        stdtau_db,
+        avgtau_dt,
+        count_dt,
+        stdtau_dt,
+        sensorZenithAngle_dt,
+        year+day,
+        files_AERDB,
+        files_AERDT,
+        data_export_path
+    )
+    if writer_queue is not None:
+        writer_queue.put(export_args)
+        logger.info(f"Queued NetCDF export for {year+day} to the writer process.")
+    else:
+        export_netcdf(*export_args)
+
+
 def process_data(
     grid_size: float,
     year: str,
@@ -19,6 +156,7 @@ def process_data(
     min_lat: float,
     max_lat: float,
     creds: dict,
+    writer_queue=None,
 ) -> None:
     """
     Processes satellite data in parallel by gridding, combining, and exporting results.
@@ -33,6 +171,8 @@ def process_data(
         min_lat (float): The minimum latitude for the region of interest.
         max_lat (float): The maximum latitude for the region of interest.
         creds (dict): The AWS credentials for accessing the data.
+        writer_queue: Optional queue of the dedicated NetCDFWriter process; when
+            set, the export is delegated to the single writer.
 
     Returns:
         None
@@ -43,71 +183,33 @@ def process_data(
         logger.set_date(current_processing_date) # setting date for logging files for each process
         logger.info(f"===== Current CHILD WORKER PID is {os.getpid()}, processing data for day {year+day} or {current_processing_date}, processing date is {datetime.now()} =====")
 
-        files_AERDB = get_file_list_dynamically(year, day, f"AERDB_L2_VIIRS_SNPP")
-        files_AERDT = get_file_list_dynamically(year, day, f"AERDT_L2_VIIRS_SNPP")
-
-        if not files_AERDB:
-            raise FileNotFoundError("No valid AERDB files found for the specified date range. Please verify the folder path and date range in the configuration.")
-        if not files_AERDT:
-            raise FileNotFoundError("No valid AERDT files found for the specified date range.")
-
-        # processing Aerosol-DeepBlue data
-        aod_db, lat_db, lon_db, vza_db = process_files(files_AERDB, "SNPP", "AERDB", -0.05, 5.0, creds)
-
-        # Grid the AERDB data
-        avgtau_db, stdtau_db, grdlat, grdlon, _, _, count_db, _ = grid(
-                [min_lat, max_lat, min_lon, max_lon],
-                grid_size,
-                aod_db,  
-                lat_db,
-                lon_db,
-                vza_db
-        )
+        # Resumability: skip days whose NetCDF was already exported by a
+        # previous run (the file name embeds the processing timestamp, so match
+        # on the data date)
+        existing = glob.glob(os.path.join(data_export_path, f"AER_DBDT_D10KM_L3_VIIRS_SNPP.{year+day}.*.nc"))
+        if existing:
+            logger.info(f"Output for {year+day} already exists ({existing[0]}), skipping.")
+            return True
 
-        del aod_db, lat_db, lon_db, vza_db  # Free up memory
-                
-        logger.info(f"Gridding AERDB data for {year+day} completed.")
+        # I/O-bound fetch phase (threaded), then CPU-bound grid + export phase
+        files_AERDB, files_AERDT, db_arrays, dt_arrays = fetch_day_arrays(year, day, creds)
 
-        # processing Aerosol-DarkTarget data
-        aod_dt, lat_dt, lon_dt, vza_dt = process_files(files_AERDT, "SNPP", "AERDT", -0.05, 5.0, creds)
+        logger.info(f"Reading AERDB and AERDT data for {year+day} completed.")
 
-        # Grid the AERDT data
-        avgtau_dt, stdtau_dt, _, _, _, _, count_dt, sensorZenithAngle_dt = grid(
-            [min_lat, max_lat, min_lon, max_lon],
+        grid_and_export(
             grid_size,
-            aod_dt,
-            lat_dt,
-            lon_dt,
-            vza_dt
-        )
-
-        del aod_dt, lat_dt, lon_dt, vza_dt 
-        
-        logger.info(f"Gridding AERDT data for {year+day} completed.")
-
-        # Combine Deep Blue and Dark Target data
-        dbdt_tau, dtdb_tau, avg_tau = db_dt_processing(avgtau_db, avgtau_dt)
-        
-        logger.info(f"Combining AERDB and AERDT data for {year+day} completed.")
-
-        # Export results to NetCDF
-        export_netcdf(
-            grdlon,
-            grdlat,
-            dbdt_tau,
-            dtdb_tau,
-            avg_tau,
-            avgtau_db,
-            count_db,
-            stdtau_db,
-            avgtau_dt,
-            count_dt,
-            stdtau_dt,
-            sensorZenithAngle_dt,
-            year+day,
+            year,
+            day,
+            data_export_path,
+            min_lon,
+            max_lon,
+            min_lat,
+            max_lat,
             files_AERDB,
             files_AERDT,
-            data_export_path
+            db_arrays,
+            dt_arrays,
+            writer_queue,
         )
 
         logger.info(f"Processing complete. Outputs saved NetCDF file in: {data_export_path}.")
@@ -119,5 +221,5 @@ def process_data(
         return True
     
     except Exception as e:
-        logger.error(f"An error occurred: {e}")
+        logger.error("An error occurred: %s", e)
         return False
\ No newline at end of file
@@ -1,12 +1,108 @@
-import re
 import os
-import json
+import io
 import s3fs
-from typing import Tuple
-import xarray as xr
+import h5py
+import functools
+from typing import Iterator, Tuple
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
+from numba import njit, prange, get_num_threads
 from tqdm import tqdm
 from viirs_snpp_daily_gridding.logs import logger
+from viirs_snpp_daily_gridding.s3_authentication import RefreshingCreds
+
+
+def _download_concurrent(
+    s3_fs: s3fs.S3FileSystem,
+    s3_paths: list[str],
+    max_workers: int = 32,
+) -> Iterator[tuple]:
+    """
+    Downloads whole granules concurrently and yields (path, future) pairs in
+    submission order; each future resolves to the granule bytes.
+
+    Opening an HDF5 file straight off S3 issues dozens of small range reads
+    (B-tree and chunk-index lookups), each paying a round trip. VIIRS L2
+    granules are only ~10-50 MB, so one bandwidth-bound GET per file followed
+    by in-memory parsing is far cheaper; the pool keeps many GETs in flight so
+    TCP windows stay saturated while the caller parses and releases each
+    buffer in turn.
+    """
+    with ThreadPoolExecutor(max_workers=min(max_workers, max(len(s3_paths), 1))) as pool:
+        futures = [(path, pool.submit(s3_fs.cat_file, path)) for path in s3_paths]
+        for path, future in futures:
+            yield path, future
+
+
+@functools.lru_cache(maxsize=4)
+def _get_s3_fs(access_key: str, secret_key: str, session_token: str) -> s3fs.S3FileSystem:
+    """
+    Returns a cached S3FileSystem for the given credentials.
+
+    Constructing the filesystem re-initializes aiobotocore sessions, TLS and
+    the credential chain — hundreds of ms per call — while the credentials are
+    stable for the lifetime of a job, so one handle per credential set (per
+    worker process) is enough. The enlarged connection pool lets the h5py
+    range reads for many granules run concurrently.
+    """
+    return s3fs.S3FileSystem(
+        key=access_key,
+        secret=secret_key,
+        token=session_token,
+        config_kwargs={"max_pool_connections": 64},
+    )
+
+
+# no fastmath here: its nnan assumption would compile away the x != x NaN
+# tests this kernel exists to perform, letting NaN pixels through the filter.
+# cache=True would also be a no-op (get_num_threads makes it uncacheable).
+@njit(parallel=True)
+def _compact_valid(aod, lat, lon, vza, min_value, max_value, aod_out, lat_out, lon_out, vza_out):
+    """
+    Fused filter: copies the pixels whose aod/lat/lon are all finite and whose
+    aod lies in [min_value, max_value] into the pre-allocated output buffers,
+    returning how many were kept.
+
+    Runs as two parallel sweeps over thread-sized chunks: the first counts
+    survivors per chunk, a serial prefix sum turns the counts into write
+    offsets, and the second sweep compacts each chunk into its own contiguous
+    slice of the outputs — so the threads never contend and the pixel order is
+    preserved. LLVM vectorizes the predicate (`x != x` is the NaN test), and
+    the whole pass stays at one read and one write per input array.
+    """
+    n = aod.size
+    nthreads = get_num_threads()
+    chunk = (n + nthreads - 1) // nthreads
+    offsets = np.zeros(nthreads + 1, dtype=np.int64)
+
+    for t in prange(nthreads):
+        start = t * chunk
+        end = min(start + chunk, n)
+        kept = 0
+        for k in range(start, end):
+            a = aod[k]
+            if min_value <= a <= max_value and lat[k] == lat[k] and lon[k] == lon[k]:
+                kept += 1
+        offsets[t + 1] = kept
+
+    for t in range(nthreads):
+        offsets[t + 1] += offsets[t]
+
+    for t in prange(nthreads):
+        start = t * chunk
+        end = min(start + chunk, n)
+        pos = offsets[t]
+        for k in range(start, end):
+            a = aod[k]
+            la = lat[k]
+            lo = lon[k]
+            if min_value <= a <= max_value and la == la and lo == lo:
+                aod_out[pos] = a
+                lat_out[pos] = la
+                lon_out[pos] = lo
+                vza_out[pos] = vza[k]
+                pos += 1
+    return offsets[nthreads]
 
 def process_files(
     files: list[str],
@@ -19,18 +115,62 @@ def process_files(
     """
     Reads and filters data using NumPy instead of pandas.
 
+    The AOD range filter is applied inside the per-file compaction pass in
+    read_data_from_files, so each pixel is touched once with no second
+    allocation here.
+
     Returns:
         Tuple[np.ndarray, ...]: (aod, lat, lon, vza) after filtering.
     """
-    aod, lat, lon, vza = read_data_from_files(files, data_type, satellite, creds)
-    mask = (aod >= min_value) & (aod <= max_value)
-    return aod[mask], lat[mask], lon[mask], vza[mask]
+    return read_data_from_files(files, data_type, satellite, creds, min_value, max_value)
 
 
-def read_data_from_files(file_paths: list[str], file_type: str, satellite: str, creds: dict[str]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+def _read_decoded(dataset: h5py.Dataset) -> np.ndarray:
+    """
+    Reads an HDF5 dataset into a flat NumPy array, applying the CF-style
+    _FillValue/scale_factor/add_offset attributes that xarray used to decode.
+
+    Args:
+        dataset (h5py.Dataset): The dataset to read.
+    Returns:
+        np.ndarray: 1D float array with fill values replaced by NaN.
+    """
+    data = dataset[...].reshape(-1)
+    fill_value = dataset.attrs.get("_FillValue")
+    scale_factor = dataset.attrs.get("scale_factor")
+    add_offset = dataset.attrs.get("add_offset")
+
+    # float32 is plenty for AOD and 0.1-degree lat/lon and halves the memory
+    # bandwidth of every later pass
+    if data.dtype != np.float32:
+        data = data.astype(np.float32)
+    if fill_value is not None:
+        data[data == np.float32(np.asarray(fill_value).item())] = np.nan
+    if scale_factor is not None:
+        data *= np.float32(np.asarray(scale_factor).item())
+    if add_offset is not None:
+        data += np.float32(np.asarray(add_offset).item())
+    return data
+
+
+def read_data_from_files(
+    file_paths: list[str],
+    file_type: str,
+    satellite: str,
+    creds: dict[str],
+    min_value: float = -np.inf,
+    max_value: float = np.inf,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
     """
     Reads and processes aerosol data from either AERDB or AERDT files.
 
+    Each granule is opened exactly once with h5py on top of the s3fs byte-range
+    reader, and only the four needed datasets are read. For AERDT both the
+    geolocation and geophysical groups come from the same open file handle,
+    halving the S3 round-trips compared to opening the file per group. All
+    arrays are float32 end-to-end and the NaN + AOD range filter runs as one
+    compaction pass per file.
+
     Args:
         file_paths (list[str]): List of file paths to read.
         file_type (str): Type of files to read, either "AERDB" or "AERDT".
@@ -39,55 +179,85 @@ def read_data_from_files(file_paths: list[str], file_type: str, satellite: str,
             - accessKeyId
             - secretAccessKey
             - sessionToken
+        min_value (float): Minimum valid AOD value, inclusive.
+        max_value (float): Maximum valid AOD value, inclusive.
     Returns:
-        pd.DataFrame: A DataFrame containing the processed data from all files.
+        Tuple[np.ndarray, ...]: (aod, lat, lon, vza) arrays concatenated over all files.
     """
 
-    s3_fs = s3fs.S3FileSystem(
-        key = creds['accessKeyId'],
-        secret = creds['secretAccessKey'],
-        token = creds['sessionToken'],
-    )
+    # resolve auto-refreshing credentials right before touching S3 so a token
+    # nearing expiry is renewed instead of failing the whole day
+    if isinstance(creds, RefreshingCreds):
+        creds = creds.get()
+    s3_fs = _get_s3_fs(creds['accessKeyId'], creds['secretAccessKey'], creds['sessionToken'])
 
     aod_list = []
     lat_list = []
     lon_list = []
     vza_list = []
 
-    for file_path in file_paths:
+    s3_paths = [f"s3://prod-lads/{file_type}_L2_VIIRS_{satellite}/{file_path}" for file_path in file_paths]
+
+    # tqdm writes to the terminal per granule, which interleaves badly across
+    # parallel workers and slows headless runs; keep it opt-in and log summary
+    # progress instead
+    iterator = _download_concurrent(s3_fs, s3_paths)
+    if os.environ.get("VIIRS_TQDM") == "1":
+        iterator = tqdm(iterator, total=len(file_paths), desc=f"Reading {file_type} files")
+
+    logger.info(f"Reading {len(file_paths)} {file_type} files...")
+    for i, (file_path, future) in enumerate(iterator):
+        if i > 0 and i % 50 == 0:
+            logger.info(f"Read {i}/{len(file_paths)} {file_type} files")
         try:
-            if file_type == 'AERDB':
-                s3_path = f"s3://prod-lads/AERDB_L2_VIIRS_{satellite}/{file_path}"
-                ds = xr.open_mfdataset(s3_fs.open(s3_path), decode_timedelta=True)
-                aod = ds["Aerosol_Optical_Thickness_550_Land_Ocean_Best_Estimate"].values.ravel()
-                lat = ds["Latitude"].values.ravel()
-                lon = ds["Longitude"].values.ravel()
-                vza = ds["Viewing_Zenith_Angle"].values.ravel()
-            elif file_type == 'AERDT':
-                s3_path = f"s3://prod-lads/AERDT_L2_VIIRS_{satellite}/{file_path}"
-                geolocation = xr.open_dataset(s3_fs.open(s3_path), group="geolocation_data", decode_timedelta=True)
-                geophysical = xr.open_dataset(s3_fs.open(s3_path), group="geophysical_data", decode_timedelta=True)
-                aod = geophysical["Optical_Depth_Land_And_Ocean"].values.ravel()
-                lat = geolocation["latitude"].values.ravel()
-                lon = geolocation["longitude"].values.ravel()
-                vza = geolocation["sensor_zenith_angle"].values.ravel()
-            else:
-                logger.error(f"Unsupported file type: {file_type}")
-                continue
-
-            mask = ~np.isnan(aod) & ~np.isnan(lat) & ~np.isnan(lon) #& ~np.isnan(vza)
-            aod_list.append(aod[mask])
-            lat_list.append(lat[mask])
-            lon_list.append(lon[mask])
-            vza_list.append(vza[mask])
+            # parse the prefetched granule entirely from memory
+            with h5py.File(io.BytesIO(future.result()), "r") as h5_file:
+                if file_type == 'AERDB':
+                    aod = _read_decoded(h5_file["Aerosol_Optical_Thickness_550_Land_Ocean_Best_Estimate"])
+                    lat = _read_decoded(h5_file["Latitude"])
+                    lon = _read_decoded(h5_file["Longitude"])
+                    vza = _read_decoded(h5_file["Viewing_Zenith_Angle"])
+                elif file_type == 'AERDT':
+                    aod = _read_decoded(h5_file["geophysical_data/Optical_Depth_Land_And_Ocean"])
+                    lat = _read_decoded(h5_file["geolocation_data/latitude"])
+                    lon = _read_decoded(h5_file["geolocation_data/longitude"])
+                    vza = _read_decoded(h5_file["geolocation_data/sensor_zenith_angle"])
+                else:
+                    logger.error("Unsupported file type: %s", file_type)
+                    continue
+
+            # Compact valid (finite, in-range aod) pixels in a single fused pass
+            aod_out = np.empty(aod.size, dtype=aod.dtype)
+            lat_out = np.empty(lat.size, dtype=lat.dtype)
+            lon_out = np.empty(lon.size, dtype=lon.dtype)
+            vza_out = np.empty(vza.size, dtype=vza.dtype)
+            kept = _compact_valid(aod, lat, lon, vza, min_value, max_value, aod_out, lat_out, lon_out, vza_out)
+            aod_list.append(aod_out[:kept])
+            lat_list.append(lat_out[:kept])
+            lon_list.append(lon_out[:kept])
+            vza_list.append(vza_out[:kept])
 
         except Exception as e:
-            logger.error(f"Error processing file {file_path}: {e}")
+            logger.error("Error processing file %s: %s", file_path, e)
 
-    # Concatenate all arrays (more efficient than pandas concat)
-    aod_all = np.concatenate(aod_list)
-    lat_all = np.concatenate(lat_list)
-    lon_all = np.concatenate(lon_list)
-    vza_all = np.concatenate(vza_list)
+    # Single preallocated copy instead of np.concatenate: the per-file chunks
+    # are written straight into the final buffers (one memcpy per chunk) and
+    # released immediately, halving peak RSS at this step
+    sizes = np.fromiter((a.size for a in aod_list), dtype=np.int64, count=len(aod_list))
+    total = int(sizes.sum())
+    aod_all = np.empty(total, dtype=np.float32)
+    lat_all = np.empty(total, dtype=np.float32)
+    lon_all = np.empty(total, dtype=np.float32)
+    vza_all = np.empty(total, dtype=np.float32)
+    offset = 0
+    for idx in range(len(aod_list)):
+        n = sizes[idx]
+        aod_all[offset:offset+n] = aod_list[idx]
+        lat_all[offset:offset+n] = lat_list[idx]
+        lon_all[offset:offset+n] = lon_list[idx]
+        vza_all[offset:offset+n] = vza_list[idx]
+        aod_list[idx] = lat_list[idx] = lon_list[idx] = vza_list[idx] = None
+        offset += n
+    del aod_list, lat_list, lon_list, vza_list
 
-    return aod_all, lat_all, lon_all, vza_all
\ No newline at end of file
+    return aod_all, lat_all, lon_all, vza_all
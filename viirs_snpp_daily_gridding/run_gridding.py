@@ -1,9 +1,20 @@
 import time
 import os
 import sys
-from joblib import Parallel, delayed
-from datetime import datetime, timedelta
-from viirs_snpp_daily_gridding import get_earthdata_credentials, process_data, logger
+import functools
+import pandas as pd
+from joblib import Parallel, delayed, parallel_config
+from datetime import datetime
+from viirs_snpp_daily_gridding import process_data, logger
+from viirs_snpp_daily_gridding.s3_authentication import RefreshingCreds
+from viirs_snpp_daily_gridding.export_data import NetCDFWriter
+
+
+def _process_day(year, day, *, grid_size, data_export_path, min_lon, max_lon, min_lat, max_lat, creds, writer_queue):
+    """Worker wrapper that tags the result with its (year, day) so the
+    unordered result stream can be attributed to days as it arrives. The
+    per-job constants are keyword-only so they can be bound once via partial."""
+    return (year, day), process_data(grid_size, year, day, data_export_path, min_lon, max_lon, min_lat, max_lat, creds, writer_queue)
 
 
 def run_gridding(
@@ -64,15 +75,10 @@ def run_gridding(
             
         start_date_obj = datetime.strptime(start_date, "%Y%m%d")
         end_date_obj = datetime.strptime(end_date, "%Y%m%d")
-        year_day_list = []
-        current_date = start_date_obj
 
-        # Generate a list of (year, day) tuples for the date range
-        while current_date <= end_date_obj:
-            year = str(current_date.year)
-            day_of_year = str(current_date.strftime("%j"))
-            year_day_list.append((year, day_of_year))
-            current_date += timedelta(days=1)
+        # Generate a list of (year, day) tuples for the date range, vectorized in C
+        date_range = pd.date_range(start_date_obj, end_date_obj, freq="D")
+        year_day_list = list(zip(date_range.strftime("%Y"), date_range.strftime("%j")))
 
         logger.set_date_range(start_date, end_date)
         logger.info(f"===== Current MAIN WORKER PID is {os.getpid()}, Main process started at: {datetime.now()}  =====")
@@ -86,16 +92,50 @@ def run_gridding(
         logger.info(f"Processing dates: {year_day_list}")
         logger.info(f"Start date: {start_date_obj.strftime('%Y-%m-%d')}")
         logger.info(f"End date: {end_date_obj.strftime('%Y-%m-%d')}")
-        creds = get_earthdata_credentials(earthdata_username, earthdata_password)
+        creds = RefreshingCreds(earthdata_username, earthdata_password)
+        creds.get()  # fail fast on bad credentials before the worker fan-out
         logger.info("Earthdata credentials retrieved successfully.")
 
-        results = Parallel(n_jobs=num_cores)(
-            delayed(process_data)(grid_size, year, day, data_export_path, min_lon, max_lon, min_lat, max_lat, creds)
-            for year, day in year_day_list
-        )
-        processed_days = [yd for yd, res in zip(year_day_list, results) if res]
-        failed_days = [yd for yd, res in zip(year_day_list, results) if not res]
-        success_rate = sum(results) / len(results) if results else 0.0
+        # Stream results as days complete instead of blocking on the full batch.
+        # Pin the loky backend and keep nested BLAS/HDF5 thread pools at one
+        # thread per worker so num_cores workers don't oversubscribe the machine.
+        # All NetCDF writes are funneled through one long-lived writer process
+        # so the HDF5/compressor state is initialized once and the workers
+        # never contend on the output filesystem. The context manager drains
+        # the queue and shuts the writer down even when the dispatch below
+        # raises, so queued exports are never lost to an exception
+        processed_days = []
+        failed_days = []
+        with NetCDFWriter() as writer:
+            # Bind the constants once so joblib pickles them a single time
+            # instead of serializing the full argument set with every task
+            worker = functools.partial(
+                _process_day,
+                grid_size=grid_size,
+                data_export_path=data_export_path,
+                min_lon=min_lon,
+                max_lon=max_lon,
+                min_lat=min_lat,
+                max_lat=max_lat,
+                creds=creds,
+                writer_queue=writer.queue,
+            )
+            with parallel_config(backend='loky', inner_max_num_threads=1):
+                # batch_size=1 because each day is minutes of work, far above
+                # joblib's dispatch overhead; pre_dispatch='n_jobs' keeps tasks
+                # from being eagerly pickled long before a worker can take them
+                result_stream = Parallel(n_jobs=num_cores, return_as='generator_unordered', batch_size=1, pre_dispatch='n_jobs', verbose=5)(
+                    delayed(worker)(year, day) for year, day in year_day_list
+                )
+                for (year, day), res in result_stream:
+                    if res:
+                        processed_days.append((year, day))
+                        logger.info(f"Queued export for {year}{day} ({len(processed_days) + len(failed_days)}/{len(year_day_list)} days done)")
+                    else:
+                        failed_days.append((year, day))
+                        logger.warning(f"Day {year}{day} failed ({len(processed_days) + len(failed_days)}/{len(year_day_list)} days done)")
+
+        success_rate = len(processed_days) / len(year_day_list) if year_day_list else 0.0
 
         logger.info(f"Processed {len(year_day_list)} dates")
         logger.info(f"Success rate: {success_rate:.1%}")
@@ -104,7 +144,9 @@ def run_gridding(
             logger.info(f"Successfully processed days: {processed_days}")
         if failed_days:
             logger.warning(f"Failed to process days: {failed_days}")
-        logger.info("Processing complete. Outputs saved in NetCDF files.")
+        # 'processed' means the day's export was handed to the writer; a write
+        # the writer itself failed shows up in its own error log, not here
+        logger.info("Processing complete. Queued exports drained; any write failures are reported by the writer process log.")
 
         # Calculate elapsed time
         end_time = time.time()
@@ -1 +1 @@
-from .authentication import get_earthdata_credentials
\ No newline at end of file
+from .authentication import get_earthdata_credentials, RefreshingCreds
\ No newline at end of file
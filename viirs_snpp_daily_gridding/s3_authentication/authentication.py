@@ -1,14 +1,59 @@
 import os
+import time
 import requests
+import httpx
 import base64
 import earthaccess
+import earthaccess.exceptions
 import json
+import threading
+from datetime import datetime, timedelta, timezone
 from dotenv import load_dotenv
 from requests.auth import HTTPBasicAuth
 from viirs_snpp_daily_gridding.logs import logger
 
-# Load environment variables
-load_dotenv()
+# .env loading is deferred to the first credential fetch so merely importing
+# this module (tests, --help, docs builds) does no filesystem I/O and never
+# mutates the environment as a side effect
+_dotenv_loaded = False
+
+def _ensure_dotenv() -> None:
+    global _dotenv_loaded
+    if not _dotenv_loaded:
+        load_dotenv()
+        _dotenv_loaded = True
+
+# In-process TTL cache for the LAADS S3 credentials: each fetch is an HTTPS
+# round-trip to NASA URS (~300 ms) for a token valid ~1 h, so repeat calls
+# within the token lifetime are served from here. Keyed by (username, daac)
+# so distinct logins never share tokens, guarded by a lock so concurrent
+# threads do not trigger duplicate fetches, and the entry expiry honours the
+# expiration field of the token itself when present.
+_CREDS_CACHE: dict[tuple, tuple[float, dict]] = {}
+_CREDS_LOCK = threading.Lock()
+
+# Cache-entry safety margin. Must be wider than RefreshingCreds.REFRESH_MARGIN
+# (5 min): when the wrapper refreshes a token that close to expiry, the cache
+# has to fetch a fresh one rather than hand the nearly-expired token back.
+_CREDS_CACHE_MARGIN = 360.0
+
+# Long-lived Auth object: earthaccess.login() repeats the EDL handshake each
+# time it is called, so the authenticated instance from the first login is
+# kept and only its get_s3_credentials is exercised afterwards
+_AUTH = None
+
+def _creds_ttl(creds: dict) -> float:
+    """Seconds of cache validity for a creds dict, minus the safety margin."""
+    expiration = creds.get("expiration") or creds.get("Expiration")
+    if expiration is not None:
+        try:
+            expires_at = datetime.fromisoformat(str(expiration))
+            if expires_at.tzinfo is None:
+                expires_at = expires_at.replace(tzinfo=timezone.utc)
+            return (expires_at - datetime.now(timezone.utc)).total_seconds() - _CREDS_CACHE_MARGIN
+        except ValueError:
+            pass
+    return 3300.0
 
 def get_earthdata_credentials(username, password):
     """
@@ -16,22 +61,106 @@ def get_earthdata_credentials(username, password):
     Args:
         username (str): Earthdata username
         password (str): Earthdata password
+
+    When an EDL_TOKEN environment variable is set (e.g. via .env), the login
+    uses that bearer token instead of the netrc basic-auth flow, which cuts
+    the EDL redirect chain to roughly a quarter of the HTTP round-trips.
     Returns:
         dict: A dictionary containing the S3 credentials (access key, secret key, and session token).
     Raises:
         ValueError: If the Earthdata username or password is not provided.
         requests.RequestException: If there is a failure during the request to retrieve credentials.
     """
+    global _AUTH
+    _ensure_dotenv()
     if not username or not password:
         logger.error("Earthdata username or password not provided.")
         raise ValueError("Missing Earthdata credentials")
-    try:
-        # if you already have these set up in your environment, you can comment out the next two lines
-        os.environ["EARTHDATA_USERNAME"] = username
-        os.environ["EARTHDATA_PASSWORD"] = password 
-        earthaccess.login(strategy="netrc")
-        creds = earthaccess.get_s3_credentials(daac="LAADS")
-        return creds
-    except requests.RequestException as e:
-        logger.error(f"Request failed: {e}")
-        raise
\ No newline at end of file
+    key = (username, "LAADS")
+    with _CREDS_LOCK:
+        entry = _CREDS_CACHE.get(key)
+        if entry is not None and time.monotonic() < entry[0]:
+            return entry[1]
+        try:
+            # if you already have these set up in your environment, you can comment out the next two lines
+            os.environ["EARTHDATA_USERNAME"] = username
+            os.environ["EARTHDATA_PASSWORD"] = password
+            # the URS login itself is stateful and only needs to happen once per
+            # process; subsequent calls reuse the authenticated Auth object and
+            # just re-fetch the short-lived S3 token from it.
+            # A bearer token (EDL_TOKEN in the environment / .env) skips the
+            # EDL basic-auth redirect chain — about a quarter of the HTTP
+            # round-trips of the netrc path — so prefer it when configured.
+            if _AUTH is None:
+                edl_token = os.environ.get("EDL_TOKEN")
+                if edl_token:
+                    os.environ.setdefault("EARTHDATA_TOKEN", edl_token)
+                    _AUTH = earthaccess.login(strategy="environment")
+                else:
+                    _AUTH = earthaccess.login(strategy="netrc")
+            creds = _AUTH.get_s3_credentials(daac="LAADS")
+            _CREDS_CACHE[key] = (time.monotonic() + _creds_ttl(creds), creds)
+            return creds
+        except (requests.RequestException,
+                httpx.HTTPError,
+                earthaccess.exceptions.LoginAttemptFailure,
+                earthaccess.exceptions.LoginStrategyUnavailable,
+                RuntimeError) as e:
+            # earthaccess raises its own exception types (and may bubble
+            # httpx errors or RuntimeError); the old requests-only clause
+            # never fired for those, so failures escaped unlogged
+            logger.error("Request failed: %s", e)
+            raise
+
+
+class RefreshingCreds:
+    """
+    Auto-refreshing wrapper around the LAADS S3 credentials.
+
+    The DAAC hands out short-lived STS tokens (~1 hour); on multi-day jobs the
+    token retrieved before the worker fan-out expires mid-run and every
+    subsequent S3 read fails, so whole days are silently counted as failed.
+    This wrapper stores the Earthdata login and re-fetches the credentials
+    whenever the current token is within 5 minutes of its expiration. Workers
+    call .get() right before touching S3.
+    """
+
+    REFRESH_MARGIN = timedelta(minutes=5)
+
+    def __init__(self, username: str, password: str):
+        self._username = username
+        self._password = password
+        self._creds = None
+        self._expires_at = None
+        self._lock = threading.Lock()
+
+    def get(self) -> dict:
+        """Returns a currently-valid credentials dict, refreshing if needed."""
+        with self._lock:
+            now = datetime.now(timezone.utc)
+            if self._creds is None or self._expires_at is None or now >= self._expires_at - self.REFRESH_MARGIN:
+                self._refresh(now)
+            return self._creds
+
+    def _refresh(self, now: datetime) -> None:
+        self._creds = get_earthdata_credentials(self._username, self._password)
+        try:
+            self._expires_at = datetime.fromisoformat(self._creds["expiration"])
+            if self._expires_at.tzinfo is None:
+                self._expires_at = self._expires_at.replace(tzinfo=timezone.utc)
+        except (KeyError, ValueError):
+            # no usable expiration field; assume the usual one-hour lifetime
+            self._expires_at = now + timedelta(minutes=55)
+        logger.info(f"Refreshed LAADS S3 credentials, valid until {self._expires_at}.")
+
+    # the lock cannot cross process boundaries; each worker gets a fresh one
+    # and re-fetches credentials on first use
+    def __getstate__(self):
+        return {"_username": self._username, "_password": self._password}
+
+    def __setstate__(self, state):
+        self._username = state["_username"]
+        self._password = state["_password"]
+        self._creds = None
+        self._expires_at = None
+        self._lock = threading.Lock()
\ No newline at end of file
@@ -1 +1 @@
-from .web_scraping import get_file_list_dynamically
\ No newline at end of file
+from .web_scraping import get_file_list_dynamically, iter_file_list_dynamically, get_file_lists, get_file_lists_async, get_file_lists_bulk, s3_list_files
@@ -1,8 +1,164 @@
 import os
-import requests
-from bs4 import BeautifulSoup
+import json
+import functools
+import time
+import asyncio
+import httpx
+import re
+from datetime import datetime, timezone
+from typing import Iterator
+from concurrent.futures import ThreadPoolExecutor
 
-def get_file_list_dynamically(year: int, day: int, product: str) -> list[str]:
+# Bounded connect time so a black-holed SYN cannot hang a run, 30 s for the
+# body; the pool is sized for the bulk/async fetch paths
+_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+
+# Transient LAADS failures (rate limiting, gateway errors, TCP resets) are
+# retried with exponential backoff so a single 503 cannot abort an entire
+# gridding run
+_RETRY_TOTAL = 5
+_RETRY_BACKOFF = 0.5
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# One shared HTTP/2 client so repeated listing calls multiplex over a single
+# kept-alive TLS connection to ladsweb instead of paying a fresh TCP+TLS
+# handshake per (year, day, product); gzip/brotli cut the bytes of the
+# highly repetitive index HTML
+_CLIENT = httpx.Client(http2=True, headers={"Accept-Encoding": "gzip, br"},
+                       timeout=_TIMEOUT, limits=_LIMITS)
+
+# longest href the overlap window must cover so a match split across two
+# network reads is still seen by the scanner
+_MAX_HREF = 512
+
+def _iter_scan_listing_stream(response: httpx.Response, seen: dict) -> "Iterator[str]":
+    """
+    Scans a streamed listing response chunk by chunk, yielding each new .nc
+    name as soon as it appears on the wire. A small tail overlap is carried
+    between reads so hrefs split across chunk boundaries still match; `seen`
+    deduplicates across chunks (and across retry attempts). Peak memory stays
+    at one 64 KB chunk and the regex work overlaps with the network reads.
+    """
+    tail = b""
+    for chunk in response.iter_bytes(64 * 1024):
+        buf = tail + chunk
+        last = 0
+        for m in _NC_HREF.finditer(buf):
+            # hrefs on the Apache index are plain URL paths, so a tail
+            # rsplit replaces the generic (and slower) os.path.basename;
+            # the regex already guarantees the .nc suffix
+            name = m.group(1).decode().rsplit('/', 1)[-1]
+            if name not in seen:
+                seen[name] = None
+                yield name
+            last = m.end()
+        tail = buf[max(len(buf) - _MAX_HREF, last):]
+
+def _iter_listing_with_retries(client: httpx.Client, url: str, seen: dict) -> "Iterator[str]":
+    """Streamed listing fetch with exponential backoff on transient failures."""
+    for attempt in range(_RETRY_TOTAL):
+        try:
+            with client.stream("GET", url) as r:
+                if r.status_code not in _RETRY_STATUSES:
+                    r.raise_for_status()
+                    yield from _iter_scan_listing_stream(r, seen)
+                    return
+        except httpx.TransportError:
+            if attempt == _RETRY_TOTAL - 1:
+                raise
+        time.sleep(_RETRY_BACKOFF * (2 ** attempt))
+    r.raise_for_status()
+
+_BASE_URL = 'https://ladsweb.modaps.eosdis.nasa.gov/archive/allData/5200'
+
+def _listing_url(year, day, product) -> str:
+    return f'{_BASE_URL}/{product}/{year}/{day}/'
+
+# The listing page is a machine-generated Apache index where every granule
+# appears as href="...nc"; a compiled byte-regex scan extracts them without
+# building any HTML tree
+_NC_HREF = re.compile(rb'href="([^"]+\.nc)"')
+
+def _parse_listing(content: bytes) -> list[str]:
+    """
+    Extracts the .nc granule names from a LAADS directory index page with a
+    single regex pass over the raw bytes — no DOM construction. dict.fromkeys
+    deduplicates in the same sweep while keeping the listing order, so the
+    returned granules stay chronologically sorted as on the index page.
+    """
+    return list(dict.fromkeys(m.decode().rsplit('/', 1)[-1] for m in _NC_HREF.findall(content)))
+
+# A finalized day's listing is immutable, so it is cached in memory for the
+# process lifetime and as a JSON file for later runs, turning repeat listing
+# calls into dict/file lookups instead of HTTPS round trips. The current day
+# is never cached because granules are still being added to it.
+_LISTING_CACHE: dict[tuple, list[str]] = {}
+_CACHE_DIR = os.path.join(".cache", "laads_listings")
+
+def _is_current_day(year, day) -> bool:
+    now = datetime.now(timezone.utc)
+    try:
+        return int(year) == now.year and int(day) == now.timetuple().tm_yday
+    except (TypeError, ValueError):
+        return True  # unparseable date: play safe and skip the cache
+
+def _disk_cache_path(key: tuple) -> str:
+    product, year, day = key
+    return os.path.join(_CACHE_DIR, f"{product}.{year}.{day}.json")
+
+def _read_disk_cache(key: tuple):
+    try:
+        with open(_disk_cache_path(key)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _write_disk_cache(key: tuple, file_list: list[str]) -> None:
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        with open(_disk_cache_path(key), "w") as f:
+            json.dump(file_list, f)
+    except OSError:
+        pass  # caching is best-effort; the listing itself already succeeded
+
+def iter_file_list_dynamically(year: int, day: int, product: str, session: httpx.Client = None) -> "Iterator[str]":
+    '''
+    Generator form of the listing fetch: yields granule names for the given
+    (year, day, product) as they are discovered in the streaming response, so
+    callers can start issuing S3 reads while the tail of the index page is
+    still in flight. Cached listings are replayed from memory/disk.
+
+    Params:
+    year-> the year for which the data to fetch
+    day -> the day for which the data to fetch
+    product -> the product type from LAADS DAAC webpage
+    session -> optional httpx.Client to use; defaults to the shared HTTP/2 client
+
+    Yields:
+    granule file names for the corresponding product and date
+    '''
+    key = (str(product), str(year), str(day))
+    cacheable = not _is_current_day(year, day)
+    if cacheable:
+        cached = _LISTING_CACHE.get(key)
+        if cached is None:
+            cached = _read_disk_cache(key)
+            if cached is not None:
+                _LISTING_CACHE[key] = cached
+        if cached is not None:
+            yield from cached
+            return
+
+    seen: dict[str, None] = {}
+    yield from _iter_listing_with_retries(session or _CLIENT, _listing_url(year, day, product), seen)
+
+    if cacheable and seen:
+        file_list = list(seen)
+        _LISTING_CACHE[key] = file_list
+        _write_disk_cache(key, file_list)
+
+def get_file_list_dynamically(year: int, day: int, product: str, session: httpx.Client = None) -> list[str]:
     '''
     Given a productname, year and a day, fetches list of files for the product to be used in the s3 bucket url
 
@@ -10,20 +166,113 @@ def get_file_list_dynamically(year: int, day: int, product: str) -> list[str]:
     year-> the year for which the data to fetch
     day -> the day for which the data to fetch
     product -> the product type from LAADS DAAC webpage
+    session -> optional httpx.Client to use; defaults to the shared HTTP/2 client
 
     Returns:
     file_list -> list of files for the corresponding product for the given date
     '''
-    file_list = []
+    return list(iter_file_list_dynamically(year, day, product, session=session))
 
-    URL = f'https://ladsweb.modaps.eosdis.nasa.gov/archive/allData/5200/{product}/{year}/{day}/'
-    result = requests.get(URL)
 
-    soup = BeautifulSoup(result.text, "html.parser")
+async def get_file_lists_async(triples: list[tuple], concurrency: int = 10) -> list[list[str]]:
+    '''
+    Fetches many LAADS listings concurrently over one HTTP/2 connection.
 
-    for link in soup.find_all("a"):
-        href = link.get("href")
-        if href and href.endswith(".nc"): 
-            file_list.append(os.path.basename(href))
+    Each listing is a ~hundreds-of-ms HTTPS round trip, so looping the sync
+    scraper over a year of days is minutes of pure network wait; multiplexing
+    the requests through a shared AsyncClient collapses that to a few seconds.
 
-    return list(set(file_list))
\ No newline at end of file
+    Params:
+    triples -> list of (year, day, product) tuples to fetch
+    concurrency -> maximum number of in-flight requests
+
+    Returns:
+    list of file lists, one per input triple, in input order
+    '''
+    sem = asyncio.Semaphore(concurrency)
+
+    async def _fetch(client, year, day, product):
+        url = _listing_url(year, day, product)
+        async with sem:
+            for attempt in range(_RETRY_TOTAL):
+                try:
+                    r = await client.get(url)
+                    if r.status_code not in _RETRY_STATUSES:
+                        r.raise_for_status()
+                        return _parse_listing(r.content)
+                except httpx.TransportError:
+                    if attempt == _RETRY_TOTAL - 1:
+                        raise
+                await asyncio.sleep(_RETRY_BACKOFF * (2 ** attempt))
+            r.raise_for_status()
+            return _parse_listing(r.content)
+
+    async with httpx.AsyncClient(http2=True, headers={"Accept-Encoding": "gzip, br"},
+                                 timeout=_TIMEOUT, limits=_LIMITS) as client:
+        tasks = [_fetch(client, year, day, product) for year, day, product in triples]
+        return await asyncio.gather(*tasks)
+
+
+def get_file_lists(triples: list[tuple], concurrency: int = 10) -> list[list[str]]:
+    '''Sync wrapper around get_file_lists_async for callers without an event loop.'''
+    return asyncio.run(get_file_lists_async(triples, concurrency=concurrency))
+
+
+def get_file_lists_bulk(triples: list[tuple], workers: int = 16) -> list[list[str]]:
+    '''
+    Thread-pool variant of the batched fetch, for callers already running
+    inside an event loop or otherwise unable to use asyncio.run. The GIL is
+    released during socket I/O, so the listing requests overlap, and every
+    worker reuses the shared pooled client.
+
+    Params:
+    triples -> list of (year, day, product) tuples to fetch
+    workers -> number of concurrent fetch threads
+
+    Returns:
+    list of file lists, one per input triple, in input order
+    '''
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        return list(ex.map(lambda t: get_file_list_dynamically(*t), triples))
+
+
+@functools.lru_cache(maxsize=4)
+def _get_s3_client(access_key: str, secret_key: str, session_token: str):
+    """One boto3 S3 client per credential set, shared across listings."""
+    import boto3
+    return boto3.client(
+        's3',
+        aws_access_key_id=access_key,
+        aws_secret_access_key=secret_key,
+        aws_session_token=session_token,
+    )
+
+
+def s3_list_files(product: str, year: int, day: int, creds: dict) -> list[str]:
+    '''
+    Lists a day's granules with an authenticated S3 ListObjectsV2 instead of
+    scraping the HTML index: one compact paginated response of up to 1000
+    keys per request, no HTML render or parse, and typically several times
+    faster than the web listing.
+
+    Params:
+    product -> the product type, e.g. "AERDB_L2_VIIRS_SNPP"
+    year -> the year for which the data to fetch
+    day -> the day of year for which the data to fetch
+    creds -> S3 credentials dict with accessKeyId/secretAccessKey/sessionToken
+
+    Returns:
+    file_list -> list of granule file names for the product and date
+    '''
+    client = _get_s3_client(creds['accessKeyId'], creds['secretAccessKey'], creds['sessionToken'])
+    # prod-lads keys are flat under the product folder and the granule names
+    # embed the acquisition date as .AYYYYDDD., so the date selects a prefix
+    prefix = f"{product}/{product}.A{int(year)}{int(day):03d}"
+    file_list = []
+    paginator = client.get_paginator('list_objects_v2')
+    for page in paginator.paginate(Bucket='prod-lads', Prefix=prefix):
+        for obj in page.get('Contents', []):
+            key = obj['Key']
+            if key.endswith('.nc'):
+                file_list.append(key.rsplit('/', 1)[-1])
+    return file_list